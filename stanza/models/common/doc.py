@@ -3,14 +3,13 @@ Basic data structures
 """
 
 import io
-import re
 import json
+import sys
+from functools import lru_cache
+from operator import attrgetter
 
 from stanza.models.ner.utils import decode_from_bioes
 
-multi_word_token_id = re.compile(r"([0-9]+)-([0-9]+)")
-multi_word_token_misc = re.compile(r".*MWT=Yes.*")
-
 ID = 'id'
 TEXT = 'text'
 LEMMA = 'lemma'
@@ -27,10 +26,99 @@ START_CHAR = 'start_char'
 END_CHAR = 'end_char'
 TYPE = 'type'
 
+# default fields dumped by `Token.to_dict` and `Word.to_dict`, fetched from their backing slots in one call
+TOKEN_DICT_FIELDS = (ID, TEXT, NER, MISC)
+WORD_DICT_FIELDS = (ID, TEXT, LEMMA, UPOS, XPOS, FEATS, HEAD, DEPREL, DEPS, MISC)
+_token_dict_getter = attrgetter(*[f'_{field}' for field in TOKEN_DICT_FIELDS])
+_word_dict_getter = attrgetter(*[f'_{field}' for field in WORD_DICT_FIELDS])
+# fields shown by `Word.pretty_print`
+WORD_PRETTY_FIELDS = (ID, TEXT, LEMMA, UPOS, XPOS, FEATS, HEAD, DEPREL, LAS)
+_word_pretty_getter = attrgetter(*[f'_{field}' for field in WORD_PRETTY_FIELDS])
+
+# NER tags that never start or continue an entity
+_NON_ENTITY_TAGS = frozenset([None, 'O'])
+
+def _null_to_none(value):
+    """ Map the CoNLL-U placeholder '_' to None. """
+    return None if value == '_' else value
+
+def _lemma_value(value, text):
+    """ Normalize a lemma. A '_' lemma is kept as is when the word itself is '_'. """
+    return value if text == '_' else _null_to_none(value)
+
+def _head_value(value):
+    """ Normalize a head id to an int, or None if it is missing. """
+    value = _null_to_none(value)
+    return int(value) if value is not None else None
+
+def _intern(value):
+    """ Intern a categorical string value (e.g., a POS tag), so that all words share a single copy of it. """
+    return sys.intern(value) if type(value) is str else value
+
+def _mwt_id(tid):
+    """ Split a multi-word token id such as '1-2' into its (start, end) strings. Return None for any other id. """
+    i = tid.find('-')
+    if i > 0 and tid[:i].isdigit() and tid[i+1:].isdigit():
+        return tid[:i], tid[i+1:]
+    return None
+
+def _check_span_tokens(tokens):
+    assert isinstance(tokens, list), 'Tokens must be provided as a list to construct a span.'
+    assert len(tokens) > 0, "Tokens of a span cannot be an empty list."
+
+def _split_misc(misc):
+    """ Split a `misc` string into a tuple of (attribute name, value) pairs. """
+    attrs = []
+    for item in misc.split('|'):
+        key_value = item.split('=', 1)
+        if len(key_value) == 1: continue # some key_value can not be splited
+        key, value = key_value
+        if key in [START_CHAR, END_CHAR]:
+            value = int(value)
+        attrs.append((f'_{key}', value))
+    return tuple(attrs)
+
+_split_misc_cached = lru_cache(maxsize=4096)(_split_misc)
+
+def _parse_misc(misc):
+    """ Parse a `misc` string into a tuple of (attribute name, value) pairs. Without character offsets, the same
+    few `misc` values (e.g., 'SpaceAfter=No') repeat across a corpus, so those are cached by the raw string.
+    Offsets make a string practically unique to its token, so such strings bypass the cache.
+    """
+    if START_CHAR in misc or END_CHAR in misc:
+        return _split_misc(misc)
+    return _split_misc_cached(misc)
+
+_json_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+def _write_json_dicts(out, dicts, indent=''):
+    """ Write a list of flat dicts to `out`, laid out exactly as `json.dumps(dicts, indent=2, ensure_ascii=False)`
+    would, where `indent` is the indentation of the enclosing list.
+
+    Every value must be a scalar (str, int, float, bool); nested lists or dicts are not laid out with indentation.
+    This holds for the output of `Token.to_dict` and `Word.to_dict`.
+    """
+    if len(dicts) == 0:
+        out.write('[]')
+        return
+    inner = indent + '  '
+    out.write('[')
+    for i, d in enumerate(dicts):
+        out.write(f'\n{inner}' if i == 0 else f',\n{inner}')
+        if len(d) == 0:
+            out.write('{}')
+            continue
+        out.write('{')
+        out.write(','.join([f'\n{inner}  {_json_encode(k)}: {_json_encode(v)}' for k, v in d.items()]))
+        out.write(f'\n{inner}}}')
+    out.write(f'\n{indent}]')
+
 class Document:
     """ A document class that stores attributes of a document and carries a list of sentences.
     """
 
+    __slots__ = ('_sentences', '_text', '_num_tokens', '_num_words', '_ents', '__weakref__')
+
     def __init__(self, sentences, text=None):
         """ Construct a document given a list of sentences in the form of lists of CoNLL-U dicts.
 
@@ -108,14 +196,15 @@ class Document:
         self._ents = value
 
     def _process_sentences(self, sentences):
-        self.sentences = []
-        for tokens in sentences:
-            self.sentences.append(Sentence(tokens, doc=self))
-            begin_idx, end_idx = self.sentences[-1].tokens[0].start_char, self.sentences[-1].tokens[-1].end_char
-            if all([self.text is not None, begin_idx is not None, end_idx is not None]): self.sentences[-1].text = self.text[begin_idx: end_idx]
+        self._sentences = sents = [Sentence(tokens, doc=self) for tokens in sentences]
+        text = self._text
+        if text is not None:
+            for sentence in sents:
+                begin_idx, end_idx = sentence._tokens[0]._start_char, sentence._tokens[-1]._end_char
+                if begin_idx is not None and end_idx is not None: sentence._text = text[begin_idx: end_idx]
 
-        self.num_tokens = sum([len(sentence.tokens) for sentence in self.sentences])
-        self.num_words = sum([len(sentence.words) for sentence in self.sentences])
+        self._num_tokens = sum(len(sentence._tokens) for sentence in sents)
+        self._num_words = sum(len(sentence._words) for sentence in sents)
 
     def get(self, fields, as_sentences=False, from_token=False):
         """ Get fields from a list of field names. If only one field name is provided, return a list
@@ -133,19 +222,19 @@ class Document:
         assert isinstance(fields, list), "Must provide field names as a list."
         assert len(fields) >= 1, "Must have at least one field."
 
+        # fetch all requested fields of a unit in one call
+        getter = attrgetter(*fields)
         results = []
         for sentence in self.sentences:
-            cursent = []
             # decide word or token
             if from_token:
                 units = sentence.tokens
             else:
                 units = sentence.words
-            for unit in units:
-                if len(fields) == 1:
-                    cursent += [getattr(unit, fields[0])]
-                else:
-                    cursent += [[getattr(unit, field) for field in fields]]
+            if len(fields) == 1:
+                cursent = [getter(unit) for unit in units]
+            else:
+                cursent = [list(getter(unit)) for unit in units]
 
             # decide whether append the results as a sentence or a whole list
             if as_sentences:
@@ -170,20 +259,19 @@ class Document:
         assert (to_token and self.num_tokens == len(contents)) or self.num_words == len(contents), \
             "Contents must have the same number as the original file."
 
-        cidx = 0
-        for sentence in self.sentences:
-            # decide word or token
-            if to_token:
-                units = sentence.tokens
-            else:
-                units = sentence.words
-            for unit in units:
-                if len(fields) == 1:
-                    setattr(unit, fields[0], contents[cidx])
-                else:
-                    for field, content in zip(fields, contents[cidx]):
-                        setattr(unit, field, content)
-                cidx += 1
+        # decide word or token
+        if to_token:
+            units = self.iter_tokens()
+        else:
+            units = self.iter_words()
+        if len(fields) == 1:
+            field = fields[0]
+            for unit, content in zip(units, contents):
+                setattr(unit, field, content)
+        else:
+            for unit, content in zip(units, contents):
+                for field, value in zip(fields, content):
+                    setattr(unit, field, value)
         return
 
     def set_mwt_expansions(self, expansions):
@@ -195,24 +283,29 @@ class Document:
             idx_w = 0
             for token in sentence.tokens:
                 idx_w += 1
-                m = multi_word_token_id.match(token.id)
-                n = multi_word_token_misc.match(token.misc) if token.misc is not None else None
+                m = _mwt_id(token.id)
+                n = token.misc is not None and 'MWT=Yes' in token.misc
                 if not m and not n:
+                    token.id = str(idx_w)
                     for word in token.words:
                         word.id = str(idx_w)
                         word.head, word.deprel = None, None # delete dependency information
                 else:
-                    expanded = [x for x in expansions[idx_e].split(' ') if len(x) > 0]
+                    expanded = expansions[idx_e].split()
                     idx_e += 1
                     idx_w_end = idx_w + len(expanded) - 1
-                    token.misc = None if token.misc == 'MWT=Yes' else '|'.join([x for x in token.misc.split('|') if x != 'MWT=Yes'])
+                    if n:
+                        token.misc = None if token.misc == 'MWT=Yes' else '|'.join([x for x in token.misc.split('|') if x != 'MWT=Yes'])
                     token.id = f'{idx_w}-{idx_w_end}'
-                    token.words = []
-                    for i, e_word in enumerate(expanded):
-                        token.words.append(Word({ID: str(idx_w + i), TEXT: e_word}))
+                    # assign through the setter so that the parent of each new word is set
+                    token.words = [Word({ID: str(idx_w + i), TEXT: e_word}) for i, e_word in enumerate(expanded)]
                     idx_w = idx_w_end
-            sentence._process_tokens(sentence.to_dict()) # reprocess to update sentence.words and sentence.dependencies
-        self._process_sentences(self.to_dict()) # reprocess to update number of words
+            # update sentence.words in place; heads were deleted above and entities may refer to replaced words,
+            # so drop the dependency graph and entities as rebuilding the sentence would
+            sentence.words = [word for token in sentence.tokens for word in token.words]
+            sentence.dependencies = []
+            sentence.ents = []
+        self.num_words = sum(len(sentence.words) for sentence in self.sentences)
         assert idx_e == len(expansions), "{} {}".format(idx_e, len(expansions))
         return
 
@@ -224,8 +317,8 @@ class Document:
         expansions = []
         for sentence in self.sentences:
             for token in sentence.tokens:
-                m = multi_word_token_id.match(token.id)
-                n = multi_word_token_misc.match(token.misc) if token.misc is not None else None
+                m = _mwt_id(token.id)
+                n = token.misc is not None and 'MWT=Yes' in token.misc
                 if m or n:
                     src = token.text
                     dst = ' '.join([word.text for word in token.words])
@@ -256,14 +349,30 @@ class Document:
         """
         return [sentence.to_dict() for sentence in self.sentences]
 
+    def _json_write(self, out):
+        """ Write the document as JSON to `out` one sentence at a time, without building `to_dict()` for the whole document.
+        """
+        if len(self.sentences) == 0:
+            out.write('[]')
+            return
+        out.write('[')
+        for i, sentence in enumerate(self.sentences):
+            out.write('\n  ' if i == 0 else ',\n  ')
+            sentence._json_write(out, indent='  ')
+        out.write('\n]')
+
     def __repr__(self):
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        buf = io.StringIO()
+        self._json_write(buf)
+        return buf.getvalue()
 
 
 class Sentence:
     """ A sentence class that stores attributes of a sentence and carries a list of tokens.
     """
 
+    __slots__ = ('_tokens', '_words', '_dependencies', '_text', '_ents', '_doc', '__weakref__')
+
     def __init__(self, tokens, doc=None):
         """ Construct a setence given a list of tokens in the form of CoNLL-U dicts.
         """
@@ -278,28 +387,29 @@ class Sentence:
 
     def _process_tokens(self, tokens):
         st, en = -1, -1
-        self.tokens, self.words = [], []
+        # build the lists in locals and assign them once at the end
+        sent_tokens, sent_words = [], []
         for i, entry in enumerate(tokens):
             if ID not in entry: # manually set a 1-based id for word if not exist
                 entry[ID] = str(i+1)
-            m = multi_word_token_id.match(entry.get(ID))
-            n = multi_word_token_misc.match(entry.get(MISC)) if entry.get(MISC, None) is not None else None
+            m = _mwt_id(entry.get(ID))
+            n = entry.get(MISC) is not None and 'MWT=Yes' in entry.get(MISC)
             if m or n: # if this token is a multi-word token
-                if m: st, en = int(m.group(1)), int(m.group(2))
-                self.tokens.append(Token(entry))
+                if m: st, en = int(m[0]), int(m[1])
+                sent_tokens.append(Token(entry))
             else: # else this token is a word
                 new_word = Word(entry)
-                self.words.append(new_word)
-                idx = int(entry.get(ID))
-                if idx <= en:
-                    self.tokens[-1].words.append(new_word)
+                sent_words.append(new_word)
+                if new_word._id_int <= en:
+                    sent_tokens[-1].words.append(new_word)
                 else:
-                    self.tokens.append(Token(entry, words=[new_word]))
-                new_word.parent = self.tokens[-1]
+                    sent_tokens.append(Token(entry, words=[new_word]))
+                new_word._parent = sent_tokens[-1]
+        self._tokens, self._words = sent_tokens, sent_words
 
         # check if there is dependency info
-        is_complete_dependencies = all([word.head is not None and word.deprel is not None for word in self.words])
-        is_complete_words = (len(self.words) >= len(self.tokens)) and (len(self.words) == int(self.words[-1].id))
+        is_complete_dependencies = all(word._head is not None and word._deprel is not None for word in sent_words)
+        is_complete_words = (len(sent_words) >= len(sent_tokens)) and (len(sent_words) == sent_words[-1]._id_int)
         if is_complete_dependencies and is_complete_words: self.build_dependencies()
     
     @property
@@ -379,11 +489,14 @@ class Sentence:
         performed at and attached to the `Token`s, instead of `Word`s.
         """
         self.ents = []
-        tags = [w.ner for w in self.tokens]
+        tags = [t._ner for t in self._tokens]
+        if _NON_ENTITY_TAGS.issuperset(tags): # most sentences carry no entity, skip decoding them
+            return self.ents
         decoded = decode_from_bioes(tags)
+        tokens, doc = self._tokens, self._doc
         for e in decoded:
-            ent_tokens = self.tokens[e['start']:e['end']+1]
-            self.ents.append(Span(tokens=ent_tokens, type=e['type'], doc=self.doc, sent=self))
+            ent_tokens = tokens[e['start']:e['end']+1]
+            self.ents.append(Span._from_range(doc, self, ent_tokens, e['type'], ent_tokens[0]._start_char, ent_tokens[-1]._end_char))
         return self.ents
 
     def build_dependencies(self):
@@ -391,16 +504,16 @@ class Sentence:
         a list of (head, deprel, word).
         """
         self.dependencies = []
-        for word in self.words:
-            if int(word.head) == 0:
+        for word in self._words:
+            if word._head == 0:
                 # make a word for the ROOT
                 word_entry = {ID: "0", TEXT: "ROOT"}
                 head = Word(word_entry)
             else:
                 # id is index in words list + 1
-                head = self.words[int(word.head) - 1]
-                assert(int(word.head) == int(head.id))
-            self.dependencies.append((head, word.deprel, word))
+                head = self._words[word._head - 1]
+                assert(word._head == head._id_int)
+            self.dependencies.append((head, word._deprel, word))
 
     def print_dependencies(self, file=None):
         """ Print the dependencies for this sentence. """
@@ -443,8 +556,14 @@ class Sentence:
             ret += token.to_dict()
         return ret
 
+    def _json_write(self, out, indent=''):
+        """ Write the sentence as JSON to `out`. """
+        _write_json_dicts(out, self.to_dict(), indent=indent)
+
     def __repr__(self):
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        buf = io.StringIO()
+        self._json_write(buf)
+        return buf.getvalue()
 
 
 class Token:
@@ -453,6 +572,8 @@ class Token:
     a (multi-word) token might be expanded into multiple words that carry syntactic annotations.
     """
 
+    __slots__ = ('_id', '_text', '_misc', '_words', '_start_char', '_end_char', '_ner', '__weakref__')
+
     def __init__(self, token_entry, words=None):
         """ Construct a token given a dictionary format token entry. Optionally link itself to the corresponding words.
         """
@@ -464,21 +585,17 @@ class Token:
         self.misc = token_entry.get(MISC, None)
         self.ner = token_entry.get(NER, None)
         self.words = words if words is not None else []
+        # producers that already know the character offsets pass them directly, so `misc` needs no parsing
+        self._start_char = token_entry.get(START_CHAR, None)
+        self._end_char = token_entry.get(END_CHAR, None)
 
-        if self.misc is not None:
+        if self.misc is not None and self._start_char is None:
             self.init_from_misc()
 
     def init_from_misc(self):
         """ Create attributes by parsing from the `misc` field.
         """
-        for item in self._misc.split('|'):
-            key_value = item.split('=', 1)
-            if len(key_value) == 1: continue # some key_value can not be splited
-            key, value = key_value
-            if key in [START_CHAR, END_CHAR]:
-                value = int(value)
-            # set attribute
-            attr = f'_{key}'
+        for attr, value in _parse_misc(self._misc):
             if hasattr(self, attr):
                 setattr(self, attr, value)
 
@@ -510,7 +627,7 @@ class Token:
     @misc.setter
     def misc(self, value):
         """ Set the token's miscellaneousness value. """
-        self._misc = value if self._is_null(value) == False else None
+        self._misc = _null_to_none(value)
 
     @property
     def words(self):
@@ -542,23 +659,23 @@ class Token:
     @ner.setter
     def ner(self, value):
         """ Set the token's NER tag. Example: 'B-ORG'"""
-        self._ner = value if self._is_null(value) == False else None
+        self._ner = _intern(_null_to_none(value))
 
     def __repr__(self):
         return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
 
-    def to_dict(self, fields=[ID, TEXT, NER, MISC]):
+    def to_dict(self, fields=None):
         """ Dumps the token into a list of dictionary for this token with its extended words
-        if the token is a multi-word token.
+        if the token is a multi-word token. By default, `TOKEN_DICT_FIELDS` are dumped.
         """
         ret = []
-        if multi_word_token_id.match(self.id):
-            token_dict = {}
-            for field in fields:
-                if getattr(self, field) is not None:
-                    token_dict[field] = getattr(self, field)
-            ret.append(token_dict)
-        for word in self.words:
+        if _mwt_id(self._id):
+            if fields is None:
+                values = zip(TOKEN_DICT_FIELDS, _token_dict_getter(self))
+            else:
+                values = ((field, getattr(self, field)) for field in fields)
+            ret.append({field: value for field, value in values if value is not None})
+        for word in self._words:
             ret.append(word.to_dict())
         return ret
 
@@ -566,44 +683,42 @@ class Token:
         """ Print this token with its extended words in one line. """
         return f"<{self.__class__.__name__} id={self.id};words=[{', '.join([word.pretty_print() for word in self.words])}]>"
 
-    def _is_null(self, value):
-        return (value is None) or (value == '_')
-
 class Word:
     """ A word class that stores attributes of a word.
     """
 
+    __slots__ = ('_id', '_id_int', '_text', '_lemma', '_upos', '_xpos', '_feats', '_head', '_deprel', '_deps', '_misc', '_las',
+                 '_parent', '__weakref__')
+
     def __init__(self, word_entry):
         """ Construct a word given a dictionary format word entry.
         """
         assert word_entry.get(ID) and word_entry.get(TEXT), 'id and text should be included for the word. {}'.format(word_entry)
-        self._id, self._text, self._lemma, self._upos, self._xpos, self._feats, self._head, self._deprel, self._deps, \
-            self._misc, self._las, self._parent = [None] * 12
-
-        self.id = word_entry.get(ID)
-        self.text = word_entry.get(TEXT)
-        self.lemma = word_entry.get(LEMMA, None)
-        self.upos = word_entry.get(UPOS, None)
-        self.xpos = word_entry.get(XPOS, None)
-        self.feats = word_entry.get(FEATS, None)
-        self.head = word_entry.get(HEAD, None)
-        self.deprel = word_entry.get(DEPREL, None)
-        self.deps = word_entry.get(DEPS, None)
-        self.misc = word_entry.get(MISC, None)
-        self.las = word_entry.get(LAS, None)
-
-        if self.misc is not None:
+        self._parent = None
+
+        # words are built in bulk (e.g., when loading a treebank), so fill the slots directly instead of going
+        # through the property setters; both use the same module-level normalization helpers
+        get = word_entry.get
+        self.id = get(ID)
+        self._text = get(TEXT)
+        self._lemma = _lemma_value(get(LEMMA), self._text)
+        self._upos = _intern(_null_to_none(get(UPOS)))
+        self._xpos = _intern(_null_to_none(get(XPOS)))
+        self._feats = _intern(_null_to_none(get(FEATS)))
+        self._head = _head_value(get(HEAD))
+        self._deprel = _intern(_null_to_none(get(DEPREL)))
+        self._deps = _null_to_none(get(DEPS))
+        self._misc = _null_to_none(get(MISC))
+        self._las = _null_to_none(get(LAS))
+
+        # a word has no character offsets, so `misc` from producers that pass them explicitly holds nothing for it
+        if self.misc is not None and START_CHAR not in word_entry:
             self.init_from_misc()
 
     def init_from_misc(self):
         """ Create attributes by parsing from the `misc` field.
         """
-        for item in self._misc.split('|'):
-            key_value = item.split('=', 1)
-            if len(key_value) == 1: continue # some key_value can not be splited
-            key, value = key_value
-            # set attribute
-            attr = f'_{key}'
+        for attr, value in _parse_misc(self._misc):
             if hasattr(self, attr):
                 setattr(self, attr, value)
 
@@ -616,6 +731,8 @@ class Word:
     def id(self, value):
         """ Set the word's index value. """
         self._id = value
+        # keep an integer copy for building dependencies
+        self._id_int = int(value)
 
     @property
     def text(self):
@@ -635,7 +752,7 @@ class Word:
     @lemma.setter
     def lemma(self, value):
         """ Set the word's lemma value. """
-        self._lemma = value if self._is_null(value) == False or self._text == '_' else None
+        self._lemma = _lemma_value(value, self._text)
 
     @property
     def upos(self):
@@ -645,7 +762,7 @@ class Word:
     @upos.setter
     def upos(self, value):
         """ Set the word's universal part-of-speech value. Example: 'NOUN'"""
-        self._upos = value if self._is_null(value) == False else None
+        self._upos = _intern(_null_to_none(value))
 
     @property
     def xpos(self):
@@ -655,7 +772,7 @@ class Word:
     @xpos.setter
     def xpos(self, value):
         """ Set the word's treebank-specific part-of-speech value. Example: 'NNP'"""
-        self._xpos = value if self._is_null(value) == False else None
+        self._xpos = _intern(_null_to_none(value))
 
     @property
     def feats(self):
@@ -665,7 +782,7 @@ class Word:
     @feats.setter
     def feats(self, value):
         """ Set this word's morphological features. Example: 'Gender=Fem'"""
-        self._feats = value if self._is_null(value) == False else None
+        self._feats = _intern(_null_to_none(value))
 
     @property
     def head(self):
@@ -675,7 +792,7 @@ class Word:
     @head.setter
     def head(self, value):
         """ Set the word's governor id value. """
-        self._head = int(value) if self._is_null(value) == False else None
+        self._head = _head_value(value)
 
     @property
     def deprel(self):
@@ -685,7 +802,7 @@ class Word:
     @deprel.setter
     def deprel(self, value):
         """ Set the word's dependency relation value. Example: 'nmod'"""
-        self._deprel = value if self._is_null(value) == False else None
+        self._deprel = _intern(_null_to_none(value))
 
     @property
     def las(self):
@@ -695,7 +812,7 @@ class Word:
     @las.setter
     def las(self, value):
         """ Set the word's label attachement score """
-        self._las = value if self._is_null(value) == False else None
+        self._las = _null_to_none(value)
 
     @property
     def deps(self):
@@ -705,7 +822,7 @@ class Word:
     @deps.setter
     def deps(self, value):
         """ Set the word's dependencies value. """
-        self._deps = value if self._is_null(value) == False else None
+        self._deps = _null_to_none(value)
 
     @property
     def misc(self):
@@ -715,7 +832,7 @@ class Word:
     @misc.setter
     def misc(self, value):
         """ Set the word's miscellaneousness value. """
-        self._misc = value if self._is_null(value) == False else None
+        self._misc = _null_to_none(value)
 
     @property
     def parent(self):
@@ -731,43 +848,34 @@ class Word:
         """
         self._parent = value
 
-    @property
-    def pos(self):
-        """ Access the universal part-of-speech of this word. Example: 'NOUN'"""
-        return self._upos
-
-    @pos.setter
-    def pos(self, value):
-        """ Set the word's universal part-of-speech value. Example: 'NOUN'"""
-        self._upos = value if self._is_null(value) == False else None
+    # `pos` is an alias of `upos` and shares its getter and setter
+    pos = upos
 
     def __repr__(self):
         return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
 
-    def to_dict(self, fields=[ID, TEXT, LEMMA, UPOS, XPOS, FEATS, HEAD, DEPREL, DEPS, MISC]):
-        """ Dumps the word into a dictionary.
+    def to_dict(self, fields=None):
+        """ Dumps the word into a dictionary. By default, `WORD_DICT_FIELDS` are dumped.
         """
-        word_dict = {}
-        for field in fields:
-            if getattr(self, field) is not None:
-                word_dict[field] = getattr(self, field)
-        return word_dict
+        if fields is None:
+            values = zip(WORD_DICT_FIELDS, _word_dict_getter(self))
+        else:
+            values = ((field, getattr(self, field)) for field in fields)
+        return {field: value for field, value in values if value is not None}
 
     def pretty_print(self):
         """ Print the word in one line. """
-        features = [ID, TEXT, LEMMA, UPOS, XPOS, FEATS, HEAD, DEPREL, LAS]
-        feature_str = ";".join(["{}={}".format(k, getattr(self, k)) for k in features if getattr(self, k) is not None])
+        feature_str = ";".join(["{}={}".format(k, v) for k, v in zip(WORD_PRETTY_FIELDS, _word_pretty_getter(self)) if v is not None])
         return f"<{self.__class__.__name__} {feature_str}>"
 
-    def _is_null(self, value):
-        return (value is None) or (value == '_')
-
 
 class Span:
     """ A span class that stores attributes of a textual span. A span can be typed.
     A range of objects (e.g., entity mentions) can be represented as spans.
     """
 
+    __slots__ = ('_text', '_type', '_start_char', '_end_char', '_tokens', '_words', '_doc', '_sent', '__weakref__')
+
     def __init__(self, span_entry=None, tokens=None, type=None, doc=None, sent=None):
         """ Construct a span given a span entry or a list of tokens. A valid reference to a doc
         must be provided to construct a span (otherwise the text of the span cannot be initialized).
@@ -787,6 +895,17 @@ class Span:
         if tokens is not None:
             self.init_from_tokens(tokens, type)
 
+    @classmethod
+    def _from_range(cls, doc, sent, tokens, type, start_char, end_char):
+        """ Construct a span from a list of tokens whose character offsets are already known. This skips the
+        generic constructor, but fills the span through the same code as `init_from_tokens`.
+        """
+        _check_span_tokens(tokens)
+        span = cls.__new__(cls)
+        span._doc, span._sent = doc, sent
+        span._init_from_range(tokens, type, start_char, end_char)
+        return span
+
     def init_from_entry(self, span_entry):
         self.text = span_entry.get(TEXT, None)
         self.type = span_entry.get(TYPE, None)
@@ -794,17 +913,17 @@ class Span:
         self.end_char = span_entry.get(END_CHAR, None)
 
     def init_from_tokens(self, tokens, type):
-        assert isinstance(tokens, list), 'Tokens must be provided as a list to construct a span.'
-        assert len(tokens) > 0, "Tokens of a span cannot be an empty list."
-        self.tokens = tokens
-        self.type = type
+        _check_span_tokens(tokens)
         # load start and end char offsets from tokens
-        self.start_char = self.tokens[0].start_char
-        self.end_char = self.tokens[-1].end_char
+        self._init_from_range(tokens, type, tokens[0].start_char, tokens[-1].end_char)
+
+    def _init_from_range(self, tokens, type, start_char, end_char):
+        self._tokens, self._type = tokens, type
+        self._start_char, self._end_char = start_char, end_char
         # assume doc is already provided and not None
-        self.text = self.doc.text[self.start_char:self.end_char]
+        self._text = self._doc._text[start_char:end_char]
         # collect the words of the span following tokens
-        self.words = [w for t in tokens for w in t.words]
+        self._words = [w for t in tokens for w in t._words]
 
     @property
     def doc(self):
@@ -2,6 +2,10 @@
 Utility functions for dealing with NER tagging.
 """
 
+# integer code of each BIOES tag prefix, as used by `decode_from_bioes`
+BIOES_BEGIN, BIOES_INSIDE, BIOES_END, BIOES_SINGLE = 1, 2, 3, 4
+BIOES_PREFIX_CODE = {'B-': BIOES_BEGIN, 'I-': BIOES_INSIDE, 'E-': BIOES_END, 'S-': BIOES_SINGLE}
+
 def is_bio_scheme(all_tags):
     """
     Check if BIO tagging scheme is used. Return True if so.
@@ -87,40 +91,44 @@ def decode_from_bioes(tags):
         A list of dict with start_idx, end_idx, and type values.
     """
     res = []
-    ent_idxs = []
+    # only the first and last index of an entity are needed, so keep them as ints instead of a list
+    ent_start, ent_end = None, None
     cur_type = None
 
     def flush():
-        if len(ent_idxs) > 0:
+        if ent_start is not None:
             res.append({
-                'start': ent_idxs[0], 
-                'end': ent_idxs[-1], 
+                'start': ent_start,
+                'end': ent_end,
                 'type': cur_type})
 
     for idx, tag in enumerate(tags):
-        if tag is None:
-            tag = 'O'
-        if tag == 'O':
+        if tag is None or tag == 'O':
             flush()
-            ent_idxs = []
-        elif tag.startswith('B-'): # start of new ent
+            ent_start = None
+            continue
+        # dispatch once on the tag prefix instead of trying each prefix in turn
+        code = BIOES_PREFIX_CODE.get(tag[:2], 0)
+        if code == BIOES_BEGIN: # start of new ent
             flush()
-            ent_idxs = [idx]
+            ent_start, ent_end = idx, idx
             cur_type = tag[2:]
-        elif tag.startswith('I-'): # continue last ent
-            ent_idxs.append(idx)
+        elif code == BIOES_INSIDE: # continue last ent
+            if ent_start is None: ent_start = idx
+            ent_end = idx
             cur_type = tag[2:]
-        elif tag.startswith('E-'): # end last ent
-            ent_idxs.append(idx)
+        elif code == BIOES_END: # end last ent
+            if ent_start is None: ent_start = idx
+            ent_end = idx
             cur_type = tag[2:]
             flush()
-            ent_idxs = []
-        elif tag.startswith('S-'): # start single word ent
+            ent_start = None
+        elif code == BIOES_SINGLE: # start single word ent
             flush()
-            ent_idxs = [idx]
+            ent_start, ent_end = idx, idx
             cur_type = tag[2:]
             flush()
-            ent_idxs = []
+            ent_start = None
     # flush after whole sentence
     flush()
     return res
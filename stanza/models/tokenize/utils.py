@@ -27,6 +27,14 @@ def load_mwt_dict(filename):
     else:
         return
 
+def _offset_fields(additional_info):
+    """ Return the explicit character offset fields for a token entry. They are taken from the same
+    `additional_info` that its misc string is built from, so the two always agree.
+    """
+    if START_CHAR not in additional_info:
+        return {}
+    return {START_CHAR: additional_info[START_CHAR], END_CHAR: additional_info[END_CHAR]}
+
 def process_sentence(sentence, mwt_dict=None):
     sent = []
     i = 0
@@ -42,6 +50,7 @@ def process_sentence(sentence, mwt_dict=None):
             infostr = None if len(additional_info) == 0 else '|'.join([f"{k}={additional_info[k]}" for k in additional_info])
             sent.append({ID: f'{i+1}-{i+len(expansion)}', TEXT: tok})
             if infostr is not None: sent[-1][MISC] = infostr
+            sent[-1].update(_offset_fields(additional_info))
             for etok in expansion:
                 sent.append({ID: f'{i+1}', TEXT: etok})
                 i += 1
@@ -53,6 +62,7 @@ def process_sentence(sentence, mwt_dict=None):
             infostr = None if len(additional_info) == 0 else '|'.join([f"{k}={additional_info[k]}" for k in additional_info])
             sent.append({ID: f'{i+1}', TEXT: tok})
             if infostr is not None: sent[-1][MISC] = infostr
+            sent[-1].update(_offset_fields(additional_info))
             i += 1
     return sent
 
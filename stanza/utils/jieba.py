@@ -48,7 +48,9 @@ class JiebaTokenizer():
 
             token_entry = {
                 doc.TEXT: token,
-                doc.MISC: f"{doc.START_CHAR}={offset}|{doc.END_CHAR}={offset+len(token)}"
+                doc.MISC: f"{doc.START_CHAR}={offset}|{doc.END_CHAR}={offset+len(token)}",
+                doc.START_CHAR: offset,
+                doc.END_CHAR: offset+len(token)
             }
             current_sentence.append(token_entry)
             offset += len(token)
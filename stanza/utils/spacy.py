@@ -52,7 +52,9 @@ class SpacyTokenizer():
             for tok in sent:
                 token_entry = {
                     doc.TEXT: tok.text,
-                    doc.MISC: f"{doc.START_CHAR}={tok.idx}|{doc.END_CHAR}={tok.idx+len(tok.text)}"
+                    doc.MISC: f"{doc.START_CHAR}={tok.idx}|{doc.END_CHAR}={tok.idx+len(tok.text)}",
+                    doc.START_CHAR: tok.idx,
+                    doc.END_CHAR: tok.idx+len(tok.text)
                 }
                 tokens.append(token_entry)
             sentences.append(tokens)
@@ -0,0 +1,107 @@
+"""
+Basic testing of the Document data structures
+"""
+
+import json
+import weakref
+import pytest
+
+from stanza.models.common.doc import Document, Span, ID, TEXT, LEMMA, UPOS, HEAD, DEPREL, MISC, NER
+
+pytestmark = pytest.mark.travis
+
+# one multi-word token marked by its id range only, and two marked by MWT=Yes in misc as the tokenizer does
+MWT_SENTENCES = [
+    [{ID: '1-2', TEXT: 'du'}, {ID: '1', TEXT: 'de'}, {ID: '2', TEXT: 'le'}, {ID: '3', TEXT: 'chat'}],
+    [{ID: '1', TEXT: 'au', MISC: 'SpaceAfter=No|MWT=Yes'}, {ID: '2', TEXT: 'revoir'}, {ID: '3', TEXT: 'aux', MISC: 'MWT=Yes'}]
+]
+
+MWT_EXPANDED_DICT = [
+    [{ID: '1-2', TEXT: 'du'}, {ID: '1', TEXT: 'de'}, {ID: '2', TEXT: 'le'}, {ID: '3', TEXT: 'chat'}],
+    [{ID: '1-2', TEXT: 'au', MISC: 'SpaceAfter=No'}, {ID: '1', TEXT: 'à'}, {ID: '2', TEXT: 'le'}, {ID: '3', TEXT: 'revoir'},
+     {ID: '4-5', TEXT: 'aux'}, {ID: '4', TEXT: 'à'}, {ID: '5', TEXT: 'les'}]
+]
+
+def test_set_mwt_expansions():
+    doc = Document(MWT_SENTENCES)
+    assert doc.get_mwt_expansions(evaluation=True) == ['du', 'au', 'aux']
+
+    doc.set_mwt_expansions(['de le', 'à le', ' à  les '])
+    assert doc.to_dict() == MWT_EXPANDED_DICT
+    assert doc.num_tokens == 5
+    assert doc.num_words == 8
+    assert [[word.id for word in sentence.words] for sentence in doc.sentences] == [['1', '2', '3'], ['1', '2', '3', '4', '5']]
+    assert [[token.id for token in sentence.tokens] for sentence in doc.sentences] == [['1-2', '3'], ['1-2', '3', '4-5']]
+    for sentence in doc.sentences:
+        for token in sentence.tokens:
+            for word in token.words:
+                assert word.parent is token
+        assert sentence.words == [word for token in sentence.tokens for word in token.words]
+
+    # updating in place must give the same document as rebuilding it from its dict form
+    rebuilt = Document(doc.to_dict())
+    assert repr(rebuilt) == repr(doc)
+    assert rebuilt.num_tokens == doc.num_tokens
+    assert rebuilt.num_words == doc.num_words
+    assert [(word.id, word.parent.id) for word in rebuilt.iter_words()] == \
+           [(word.id, word.parent.id) for word in doc.iter_words()]
+
+def test_set_mwt_expansions_drops_dependencies():
+    sentences = [[{ID: '1-2', TEXT: 'du', MISC: 'SpaceAfter=No'}, {ID: '1', TEXT: 'de', HEAD: 3, DEPREL: 'case'},
+                  {ID: '2', TEXT: 'le', HEAD: 3, DEPREL: 'det'}, {ID: '3', TEXT: 'chat', HEAD: 0, DEPREL: 'root'}]]
+    doc = Document(sentences)
+    sentence = doc.sentences[0]
+    assert len(sentence.dependencies) == 3
+
+    doc.set_mwt_expansions(['de le'])
+    assert sentence.dependencies == []
+    assert sentence.ents == []
+    assert all(word.head is None and word.deprel is None for word in sentence.words)
+
+    rebuilt = Document(doc.to_dict())
+    assert repr(rebuilt) == repr(doc)
+    assert rebuilt.sentences[0].dependencies == sentence.dependencies
+    assert rebuilt.sentences[0].dependencies_string() == sentence.dependencies_string()
+
+def check_repr(doc):
+    assert repr(doc) == json.dumps(doc.to_dict(), indent=2, ensure_ascii=False)
+    for sentence in doc.sentences:
+        assert repr(sentence) == json.dumps(sentence.to_dict(), indent=2, ensure_ascii=False)
+
+def test_repr_matches_json_dumps():
+    check_repr(Document([]))
+    check_repr(Document(MWT_SENTENCES))
+    text = 'Zoë "dit" \\ ça'
+    sentences = [[{ID: '1', TEXT: 'Zoë', MISC: 'start_char=0|end_char=3', LEMMA: 'Zoë', UPOS: 'PROPN', HEAD: 0, DEPREL: 'root'},
+                  {ID: '2-3', TEXT: '"dit"', MISC: 'start_char=4|end_char=9'}, {ID: '2', TEXT: '"'}, {ID: '3', TEXT: 'dit"'},
+                  {ID: '4', TEXT: '\\', MISC: 'start_char=10|end_char=11'}, {ID: '5', TEXT: 'ça', MISC: 'start_char=12|end_char=14'}]]
+    check_repr(Document(sentences, text))
+
+def test_entity_spans_match_span_constructor():
+    text = 'Emmanuel Macron visite du Paris'
+    sentences = [[{ID: '1', TEXT: 'Emmanuel', MISC: 'start_char=0|end_char=8', NER: 'B-PER'},
+                  {ID: '2', TEXT: 'Macron', MISC: 'start_char=9|end_char=15', NER: 'E-PER'},
+                  {ID: '3', TEXT: 'visite', MISC: 'start_char=16|end_char=22', NER: 'O'},
+                  {ID: '4-5', TEXT: 'du', MISC: 'start_char=23|end_char=25', NER: 'B-LOC'}, {ID: '4', TEXT: 'de'}, {ID: '5', TEXT: 'le'},
+                  {ID: '6', TEXT: 'Paris', MISC: 'start_char=26|end_char=31', NER: 'E-LOC'}]]
+    doc = Document(sentences, text)
+    sentence = doc.sentences[0]
+    ents = doc.build_ents()
+    assert [ent.text for ent in ents] == ['Emmanuel Macron', 'du Paris']
+
+    for ent, (start, end) in zip(ents, [(0, 2), (3, 5)]):
+        expected = Span(tokens=sentence.tokens[start:end], type=ent.type, doc=doc, sent=sentence)
+        assert ent.to_dict() == expected.to_dict()
+        assert ent.text == expected.text
+        assert ent.tokens == expected.tokens
+        assert ent.words == expected.words
+
+def test_weakref_and_custom_attributes():
+    doc = Document(MWT_SENTENCES)
+    sentence = doc.sentences[0]
+    token = sentence.tokens[0]
+    for obj in [doc, sentence, token, token.words[0]]:
+        assert weakref.ref(obj)() is obj
+        # the document classes use __slots__, so attributes outside of them cannot be added
+        with pytest.raises(AttributeError):
+            obj.custom_attribute = True
@@ -0,0 +1,37 @@
+"""
+Basic testing of the NER tag utilities
+"""
+
+import pytest
+
+from stanza.models.ner.utils import decode_from_bioes
+
+pytestmark = pytest.mark.travis
+
+def ent(start, end, type):
+    return {'start': start, 'end': end, 'type': type}
+
+def test_decode_complete_entities():
+    assert decode_from_bioes([]) == []
+    assert decode_from_bioes(['B-PER', 'I-PER', 'E-PER', 'O', 'S-LOC']) == [ent(0, 2, 'PER'), ent(4, 4, 'LOC')]
+
+def test_decode_null_tags():
+    assert decode_from_bioes([None, 'O']) == []
+    assert decode_from_bioes(['B-PER', None, 'O', 'S-LOC']) == [ent(0, 0, 'PER'), ent(3, 3, 'LOC')]
+
+def test_decode_without_begin():
+    # I- and E- open an entity of their own when no B- precedes them
+    assert decode_from_bioes(['I-PER']) == [ent(0, 0, 'PER')]
+    assert decode_from_bioes(['E-PER']) == [ent(0, 0, 'PER')]
+    assert decode_from_bioes(['I-PER', 'E-PER']) == [ent(0, 1, 'PER')]
+
+def test_decode_consecutive_begins():
+    # a new B- closes the open entity
+    assert decode_from_bioes(['B-PER', 'B-LOC', 'E-LOC']) == [ent(0, 0, 'PER'), ent(1, 2, 'LOC')]
+
+def test_decode_type_follows_last_tag():
+    assert decode_from_bioes(['B-PER', 'I-PER', 'I-ORG', 'O']) == [ent(0, 2, 'ORG')]
+
+def test_decode_unknown_prefixes():
+    # tags without a known BIOES prefix are skipped without closing the open entity
+    assert decode_from_bioes(['B', 'X-FOO', 'B-PER', 'X-FOO', 'E-PER']) == [ent(2, 4, 'PER')]